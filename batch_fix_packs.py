@@ -1,12 +1,19 @@
+import io
 import os
+import copy
+import mmap
+import struct
 import zipfile
+import functools
 import json
+import re
 import shutil
 from pathlib import Path
 import sys
 import time
 from collections import deque
-from ctypes import windll
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Detect emoji support
 USE_EMOJIS = True
@@ -36,6 +43,9 @@ ICONS = {
 ANSI_ENABLED = False
 if os.name == 'nt':
     try:
+        # One-time console setup; the import lives here so non-Windows
+        # platforms never touch windll at all
+        from ctypes import windll
         kernel32 = windll.kernel32
         kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
         ANSI_ENABLED = True
@@ -46,6 +56,30 @@ else:
     # Linux/Mac have native ANSI support
     ANSI_ENABLED = True
 
+# Matches model JSON entries. Compiled once so the per-entry filter is a
+# single C-level regex call instead of two Python-level string ops
+_MODEL_JSON_RE = re.compile(r'models/item/[^/]*\.json$')
+
+# Optional compiled kernel for the '#missing' -> '#0' rewrite (see
+# _fixmissing.pyx; built with `cythonize -i _fixmissing.pyx`).
+#
+# The rewrite deliberately never parses JSON - it's a plain byte
+# substitution, and that is sound:
+#  - '#missing' is pure ASCII and UTF-8 is self-synchronizing, so those
+#    eight bytes can only ever decode as that exact text, never as a
+#    slice of some multi-byte character
+#  - swapping it for '#0' inside a JSON string changes no structure;
+#    both are ordinary characters that need no escaping
+# So bytes.replace is exactly equivalent to the old decode / str.replace
+# / encode round-trip, minus the copies, and can't raise on bad input
+try:
+    from _fixmissing import fix_bytes as _fix_bytes
+except ImportError:
+    def _fix_bytes(data):
+        if b'#missing' in data:
+            return True, data.replace(b'#missing', b'#0')
+        return False, data
+
 def clear_screen_ansi():
     """Clear screen using ANSI codes - no flicker!"""
     if ANSI_ENABLED:
@@ -54,68 +88,194 @@ def clear_screen_ansi():
     else:
         os.system('cls' if os.name == 'nt' else 'clear')
 
-def move_cursor_home():
-    """Move cursor to top without clearing"""
-    if ANSI_ENABLED:
-        sys.stdout.write("\033[H")
-        sys.stdout.flush()
-
-def hide_cursor():
-    """Hide the blinking cursor"""
-    if ANSI_ENABLED:
-        sys.stdout.write("\033[?25l")
-        sys.stdout.flush()
-
 def show_cursor():
     """Show the cursor again"""
     if ANSI_ENABLED:
         sys.stdout.write("\033[?25h")
         sys.stdout.flush()
 
-def check_if_has_models(zip_path):
+def _copy_file_fast(src, dst):
     """
-    Check if zip contains model JSON files without extracting
-    Returns True if models/item/*.json files are found
+    Backup copy that keeps the bytes inside the kernel where possible.
+    Tries copy_file_range(2) first (a reflink on btrfs/XFS, so zero
+    bytes actually move), then sendfile(2) on Linux, CopyFileExW on
+    Windows, and finally shutil.copy2 as the portable fallback
     """
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for file_path in zip_ref.namelist():
-                if 'models/item/' in file_path and file_path.endswith('.json'):
-                    return True
-        return False
-    except Exception:
-        return False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            if copied == size:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass  # e.g. cross-device or filesystem without support
+
+    if sys.platform == 'linux' and hasattr(os, 'sendfile'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass  # fall through to the portable copy
+
+    if os.name == 'nt':
+        try:
+            from ctypes import windll
+            # Single kernel-side copy including metadata; nonzero = success
+            if windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+                return
+        except Exception:
+            pass
+
+    shutil.copy2(src, dst)
+
+def _read_raw_entry(zip_ref, file_info):
+    """
+    Read an entry's compressed bytes straight off the archive, skipping
+    inflate. Seeks past the local file header manually since zipfile has
+    no public raw-read API
+    """
+    fp = zip_ref.fp
+    fp.seek(file_info.header_offset)
+    fheader = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+    fp.seek(fheader[zipfile._FH_FILENAME_LENGTH] + fheader[zipfile._FH_EXTRA_FIELD_LENGTH], 1)
+    return fp.read(file_info.compress_size)
 
-def fix_missing_textures_in_memory(zip_path):
+def _write_raw_entry(zipf, file_info, compressed):
+    """
+    Append an already-compressed entry to an output ZipFile byte-for-byte,
+    so unmodified members skip the inflate+deflate round-trip. Mirrors
+    ZipFile.writestr's bookkeeping, reusing the sizes/CRC recorded in the
+    source ZipInfo
     """
-    Fix #missing textures by processing ZIP in memory
-    Returns (modified, count_fixed, buffer)
+    file_info = copy.copy(file_info)
+    file_info.flag_bits &= ~0x08  # sizes/CRC known up front - no data descriptor
+    file_info.header_offset = zipf.fp.tell()
+    zip64 = (file_info.file_size > zipfile.ZIP64_LIMIT or
+             file_info.compress_size > zipfile.ZIP64_LIMIT)
+    zipf._writecheck(file_info)
+    zipf._didModify = True
+    zipf.fp.write(file_info.FileHeader(zip64))
+    zipf.fp.write(compressed)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(file_info)
+    zipf.NameToInfo[file_info.filename] = file_info
+
+def scan_and_fix(zip_path):
+    """
+    One-pass check and fix for a single pack: the archive is opened once
+    and the no-models short-circuit shares that open with the fix loop,
+    instead of the old check_if_has_models/fix_missing_textures_in_memory
+    pair that each parsed the central directory separately.
+    Only model JSONs are inflated (through a small thread pool - zlib
+    releases the GIL, so decompression of multiple members overlaps);
+    everything else is kept as a ZipInfo reference and copied raw at
+    write time, so RSS stays O(JSON bytes) instead of O(pack size).
+    Returns (has_models, modified, count_fixed, modified_json, passthrough)
     """
     modified = False
     count_fixed = 0
-    temp_buffer = {}
+    modified_json = {}
+    passthrough = []
+
+    # Fast reject: zip filenames are stored uncompressed in the local
+    # headers and central directory, so one mmap'd find() over the raw
+    # archive (glibc memmem - SIMD-vectorized, memory-bound) can prove
+    # 'models/item/' never occurs before any zip parsing happens
+    marker_absent = False
+    try:
+        with open(zip_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'models/item/') < 0:
+                    return False, False, 0, None, None
+                # For small packs, also note whether the fix marker shows
+                # up anywhere in the raw bytes. This is only meaningful as
+                # a negative signal for STORED entries - deflated data
+                # won't contain the literal - so it's cross-checked
+                # against the partition below before being trusted
+                if len(mm) < 16 * 1024 * 1024:
+                    marker_absent = mm.find(b'#missing') < 0
+    except Exception:
+        pass  # fall through to the central-directory scan
 
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for file_info in zip_ref.infolist():
-                if file_info.filename.endswith('.json') and 'models/item/' in file_info.filename:
-                    try:
-                        content = zip_ref.read(file_info.filename).decode('utf-8')
-                        if '#missing' in content:
-                            new_content = content.replace('#missing', '#0')
-                            temp_buffer[file_info.filename] = (new_content.encode('utf-8'), file_info)
-                            count_fixed += 1
-                            modified = True
-                        else:
-                            temp_buffer[file_info.filename] = (content.encode('utf-8'), file_info)
-                    except:
-                        temp_buffer[file_info.filename] = (zip_ref.read(file_info.filename), file_info)
-                else:
-                    temp_buffer[file_info.filename] = (zip_ref.read(file_info.filename), file_info)
+            infos = zip_ref.infolist()
+
+        # Partition once: only models/item/*.json entries need inflating,
+        # the rest go straight to the raw-copy list
+        model_infos = []
+        for file_info in infos:
+            if _MODEL_JSON_RE.search(file_info.filename):
+                model_infos.append(file_info)
+            else:
+                passthrough.append(file_info)
+
+        # No model JSONs at all? Decided from the entry names alone -
+        # nothing in the pack gets inflated or buffered
+        if not model_infos:
+            return False, False, 0, None, None
+
+        # Definitely-clean reject: if b'#missing' appears nowhere in the
+        # raw archive and every model JSON is stored uncompressed, the
+        # inflate+scan loop cannot find anything either - skip it
+        if marker_absent and all(info.compress_type == zipfile.ZIP_STORED
+                                 for info in model_infos):
+            return True, False, 0, None, None
+
+        local = threading.local()
+        handles = []
+
+        def _get_handle():
+            # ZipFile objects are not thread-safe, but separate handles
+            # on the same path are fine - one per worker thread
+            zip_ref = getattr(local, 'zip_ref', None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+                handles.append(zip_ref)
+            return zip_ref
+
+        def _read_and_fix(file_info):
+            # Open by ZipInfo, not name - skips the per-entry NameToInfo
+            # lookup (the offsets in file_info are valid on any handle
+            # for the same archive)
+            with _get_handle().open(file_info) as entry:
+                fixed, content = _fix_bytes(entry.read())
+            if fixed:
+                return file_info, content, True
+            return file_info, None, False
+
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for file_info, content, fixed in pool.map(_read_and_fix, model_infos):
+                    if fixed:
+                        modified_json[file_info.filename] = (content, file_info)
+                        count_fixed += 1
+                        modified = True
+                    else:
+                        # Clean JSONs keep their original compressed bytes too
+                        passthrough.append(file_info)
+        finally:
+            for handle in handles:
+                handle.close()
 
-        return modified, count_fixed, temp_buffer
+        return True, modified, count_fixed, modified_json, passthrough
     except Exception:
-        return False, 0, None
+        return False, False, 0, None, None
 
 def truncate_filename(filename, max_length=50):
     """Truncate long filenames with ellipsis"""
@@ -123,6 +283,12 @@ def truncate_filename(filename, max_length=50):
         return filename
     return filename[:max_length-3] + "..."
 
+@functools.lru_cache(maxsize=64)
+def _bar(filled, length, fill_char):
+    """Bar body for a given fill level - cached since there are only
+    length+1 distinct strings per run"""
+    return fill_char * filled + '-' * (length - filled)
+
 def print_progress_bar(iteration, total, length=40, fill='█'):
     """Print a progress bar"""
     # Use ASCII fallback for progress bar if no emoji support
@@ -132,50 +298,167 @@ def print_progress_bar(iteration, total, length=40, fill='█'):
         return "|" + "-"*length + "| 0.0%"
     percent = f"{100 * (iteration / float(total)):.1f}"
     filled_length = int(length * iteration // total)
-    bar = fill_char * filled_length + '-' * (length - filled_length)
-    return f"|{bar}| {percent}%"
+    return f"|{_bar(filled_length, length, fill_char)}| {percent}%"
 
 def draw_frame(idx, total, zip_filename, history, status_lines):
     """Build entire TUI frame as one string - properly clears old content!"""
-    frame = []
+    # Single growing buffer instead of a list of line objects + join -
+    # one allocation path for the whole frame
+    buf = io.StringIO()
 
-    frame.append("="*70)
-    frame.append("  TEXTURE PACK BATCH FIXER [FLICKER-FREE MODE]")
-    frame.append("="*70)
-    frame.append("")
+    buf.write("="*70 + "\n")
+    buf.write("  TEXTURE PACK BATCH FIXER [FLICKER-FREE MODE]\n")
+    buf.write("="*70 + "\n")
+    buf.write("\n")
 
     # Recent history
-    frame.append("Recent completions:")
-    frame.append("-"*70)
+    buf.write("Recent completions:\n")
+    buf.write("-"*70 + "\n")
     if history:
         for item in history:
-            frame.append(item)
+            buf.write(item + "\n")
     else:
-        frame.append("(none yet)")
-    frame.append("-"*70)
+        buf.write("(none yet)\n")
+    buf.write("-"*70 + "\n")
 
     # Current pack
-    frame.append("")
-    frame.append(f"[{idx}/{total}] Processing: {truncate_filename(zip_filename, 50)}")
-    frame.append("="*70)
-    frame.append(f"Overall: {print_progress_bar(idx, total, 40)}")
-    frame.append("-"*70)
-    frame.append("")
+    buf.write("\n")
+    buf.write(f"[{idx}/{total}] Completed: {truncate_filename(zip_filename, 50)}\n")
+    buf.write("="*70 + "\n")
+    buf.write(f"Overall: {print_progress_bar(idx, total, 40)}\n")
+    buf.write("-"*70 + "\n")
+    buf.write("\n")
 
     # Status lines
     for line in status_lines:
-        frame.append(line)
+        buf.write(line + "\n")
 
-    # Add blank lines to clear old content (ensures clean slate)
-    for _ in range(10):
-        frame.append("")
+    return buf.getvalue()
+
+class FrameRenderer:
+    """
+    Diff-based TUI painter. Remembers the previously drawn frame and
+    rewrites only the lines that changed, addressing each one with a
+    cursor-position escape - no full-screen \\033[2J repaint per update.
+    Repaints are rate-limited so redraws never dominate wall time on
+    fast packs
+    """
+    MIN_INTERVAL = 0.03  # seconds between repaints
+
+    def __init__(self):
+        self.prev_lines = []
+        self.last_draw = 0.0
+        self.cursor_hidden = False
+
+    def render(self, frame_str):
+        # Throttle with a monotonic clock instead of dropping frames,
+        # so every state transition still reaches the screen
+        wait = self.MIN_INTERVAL - (time.monotonic() - self.last_draw)
+        if wait > 0:
+            time.sleep(wait)
+
+        new_lines = frame_str.split("\n")
+        if ANSI_ENABLED:
+            out = []
+            if not self.cursor_hidden:
+                # Hide the cursor as part of the first frame write rather
+                # than a separate write+flush round-trip
+                out.append("\033[?25l")
+                self.cursor_hidden = True
+            for i, line in enumerate(new_lines):
+                if i >= len(self.prev_lines) or self.prev_lines[i] != line:
+                    out.append(f"\033[{i + 1};1H\033[2K{line}")
+            # One erase-below wipes everything left over from a taller
+            # previous frame, whatever its height was
+            if len(new_lines) < len(self.prev_lines):
+                out.append(f"\033[{len(new_lines) + 1};1H\033[J")
+            if out:
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
+        else:
+            clear_screen_ansi()
+            sys.stdout.write(frame_str)
+            sys.stdout.flush()
 
-    return "\n".join(frame)
+        self.prev_lines = new_lines
+        self.last_draw = time.monotonic()
+
+def _process_one(zip_path, create_backups):
+    """
+    Process a single pack end-to-end: check for models, fix #missing,
+    backup, and rewrite. Runs inside a worker process, so no printing
+    here - the TUI lives in the main process only.
+    Returns (filename, status, fixed_count, error) where status is one
+    of 'skipped', 'clean', 'fixed', 'failed'
+    """
+    zip_filename = os.path.basename(zip_path)
+
+    has_models, modified, fixed_count, modified_json, passthrough = scan_and_fix(zip_path)
+
+    if not has_models:
+        return zip_filename, 'skipped', 0, None
+
+    try:
+        if not modified:
+            return zip_filename, 'clean', 0, None
+
+        if create_backups:
+            backup_path = os.path.join(os.path.dirname(zip_path), f"backup_{zip_filename}")
+            if not os.path.exists(backup_path):
+                # The rewrite os.replace()s a brand-new file over zip_path,
+                # so a hardlink taken now keeps the original inode alive
+                # untouched - zero bytes copied. Filesystems without
+                # hardlinks fall back to a real copy
+                try:
+                    os.link(zip_path, backup_path)
+                except OSError:
+                    _copy_file_fast(zip_path, backup_path)
+
+        temp_zip = zip_path + '.tmp'
+
+        # Open the temp file straight from an fd - skips the extra stat
+        # inside Python's open() and pins the flags/mode we want
+        fd = os.open(temp_zip, os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                     | getattr(os, 'O_BINARY', 0), 0o644)
+        with os.fdopen(fd, 'wb') as temp_fp, \
+             zipfile.ZipFile(zip_path, 'r') as zip_ref, \
+             zipfile.ZipFile(temp_fp, 'w') as zipf:
+            for filename, (content, file_info) in modified_json.items():
+                # writestr honors the compress_type the source ZipInfo
+                # already carries, so each entry keeps its original method.
+                # Tiny JSONs get ZIP_STORED outright - deflate's header
+                # overhead exceeds any savings at this size
+                if len(content) < 200 and file_info.compress_type != zipfile.ZIP_STORED:
+                    file_info = copy.copy(file_info)
+                    file_info.compress_type = zipfile.ZIP_STORED
+                zipf.writestr(file_info, content)
+            # Passthrough entries are re-read one at a time here, so peak
+            # memory is one entry's compressed bytes, not the whole pack
+            for file_info in passthrough:
+                _write_raw_entry(zipf, file_info, _read_raw_entry(zip_ref, file_info))
+
+        # Atomic swap - no window where the pack doesn't exist, and a
+        # Ctrl-C can't leave a half-written archive in its place
+        os.replace(temp_zip, zip_path)
+
+        return zip_filename, 'fixed', fixed_count, None
+
+    except Exception as e:
+        temp_zip = zip_path + '.tmp'
+        if os.path.exists(temp_zip):
+            try:
+                os.remove(temp_zip)
+            except:
+                pass
+        return zip_filename, 'failed', 0, str(e)
 
 def process_zip_files(directory=".", create_backups=True):
     """Find all zip files, check for models, and fix #missing textures"""
-    zip_files = [f for f in os.listdir(directory) 
-                 if f.endswith('.zip') and not f.startswith('backup_')]
+    # scandir keeps the dirent type info, so is_file() costs no extra
+    # stat on Linux and directories named *.zip are filtered out too
+    zip_files = [entry.name for entry in os.scandir(directory)
+                 if entry.is_file() and entry.name.endswith('.zip')
+                 and not entry.name.startswith('backup_')]
 
     if not zip_files:
         print(f"{ICONS['cross']} No zip files found in current directory!")
@@ -187,163 +470,49 @@ def process_zip_files(directory=".", create_backups=True):
     skipped_packs = []
     history = deque(maxlen=10)
 
-    hide_cursor()  # Hide blinking cursor
+    clear_screen_ansi()  # One full clear up front; the renderer diffs after this
+    renderer = FrameRenderer()  # Hides the cursor inline with its first frame
 
     try:
-        for idx, zip_filename in enumerate(zip_files, 1):
-            zip_path = os.path.join(directory, zip_filename)
-            status_lines = []
-
-            # Draw initial frame - use clear on first draw
-            if ANSI_ENABLED:
-                sys.stdout.write("\033[H\033[2J")  # Clear screen + move to home
-            else:
-                clear_screen_ansi()
-            sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-            sys.stdout.flush()
-
-            # Step 1: Check for models
-            status_lines = [f"{ICONS['search']} Checking for models..."]
-            if ANSI_ENABLED:
-                sys.stdout.write("\033[H\033[2J")
-            else:
-                clear_screen_ansi()
-            sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-            sys.stdout.flush()
-
-            if not check_if_has_models(zip_path):
-                status_lines = [f"{ICONS['search']} Checking for models... {ICONS['skip']} Skipped"]
-                if ANSI_ENABLED:
-                    sys.stdout.write("\033[H\033[2J")
-                else:
-                    clear_screen_ansi()
-                sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                sys.stdout.flush()
-                skipped_packs.append(zip_filename)
-                history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Skipped")
-                time.sleep(0.3)
-                continue
-
-            status_lines = [f"{ICONS['search']} Checking for models... {ICONS['tick']}"]
-            if ANSI_ENABLED:
-                sys.stdout.write("\033[H\033[2J")
-            else:
-                clear_screen_ansi()
-            sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-            sys.stdout.flush()
-
-            try:
-                # Step 2: Process in memory
-                status_lines.append(f"{ICONS['wrench']} Scanning & fixing...")
-                if ANSI_ENABLED:
-                    sys.stdout.write("\033[H\033[2J")
-                else:
-                    clear_screen_ansi()
-                sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                sys.stdout.flush()
-
-                modified, fixed_count, buffer = fix_missing_textures_in_memory(zip_path)
-
-                if not modified:
-                    status_lines[-1] = f"{ICONS['wrench']} Scanning & fixing... No issues"
-                    if ANSI_ENABLED:
-                        sys.stdout.write("\033[H\033[2J")
-                    else:
-                        clear_screen_ansi()
-                    sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                    sys.stdout.flush()
+        # One worker per core - each pack's decompress/scan/recompress is
+        # CPU-bound on zlib, so packs scale nearly linearly with cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {executor.submit(_process_one, os.path.join(directory, f), create_backups): f
+                       for f in zip_files}
+
+            for idx, future in enumerate(as_completed(futures), 1):
+                zip_filename = futures[future]
+                try:
+                    zip_filename, status, fixed_count, error = future.result()
+                except Exception as e:
+                    status, fixed_count, error = 'failed', 0, str(e)
+
+                if status == 'skipped':
+                    status_lines = [f"{ICONS['search']} Checking for models... {ICONS['skip']} Skipped"]
+                    skipped_packs.append(zip_filename)
+                    history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Skipped")
+                elif status == 'clean':
+                    status_lines = [f"{ICONS['wrench']} Scanning & fixing... No issues"]
                     successful_packs.append((zip_filename, 0))
                     history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Clean")
-                    time.sleep(0.3)
-                    continue
-
-                status_lines[-1] = f"{ICONS['wrench']} Scanning & fixing... Found {fixed_count} file(s)"
-                if ANSI_ENABLED:
-                    sys.stdout.write("\033[H\033[2J")
+                elif status == 'fixed':
+                    status_lines = [f"{ICONS['wrench']} Scanning & fixing... Found {fixed_count} file(s)",
+                                    f"{ICONS['check']} Fixed!"]
+                    total_fixed += fixed_count
+                    successful_packs.append((zip_filename, fixed_count))
+                    history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Fixed {fixed_count}")
                 else:
-                    clear_screen_ansi()
-                sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                sys.stdout.flush()
-                total_fixed += fixed_count
-
-                # Step 3: Backup
-                if create_backups:
-                    backup_name = f"backup_{zip_filename}"
-                    backup_path = os.path.join(directory, backup_name)
-
-                    if not os.path.exists(backup_path):
-                        status_lines.append(f"{ICONS['disk']} Creating backup...")
-                        if ANSI_ENABLED:
-                            sys.stdout.write("\033[H\033[2J")
-                        else:
-                            clear_screen_ansi()
-                        sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                        sys.stdout.flush()
-                        shutil.copy2(zip_path, backup_path)
-                        status_lines[-1] = f"{ICONS['disk']} Creating backup... {ICONS['tick']}"
-                        if ANSI_ENABLED:
-                            sys.stdout.write("\033[H\033[2J")
-                        else:
-                            clear_screen_ansi()
-                        sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                        sys.stdout.flush()
-
-                # Step 4: Write fixed version
-                status_lines.append(f"{ICONS['package']} Writing fixed ZIP...")
-                if ANSI_ENABLED:
-                    sys.stdout.write("\033[H\033[2J")
-                else:
-                    clear_screen_ansi()
-                sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                sys.stdout.flush()
-
-                temp_zip = zip_path + '.tmp'
-
-                with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for filename, (content, file_info) in buffer.items():
-                        zipf.writestr(file_info, content)
-
-                os.remove(zip_path)
-                os.rename(temp_zip, zip_path)
-
-                status_lines[-1] = f"{ICONS['package']} Writing fixed ZIP... {ICONS['tick']}"
-                status_lines.append(f"{ICONS['check']} Fixed!")
-                if ANSI_ENABLED:
-                    sys.stdout.write("\033[H\033[2J")
-                else:
-                    clear_screen_ansi()
-                sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                sys.stdout.flush()
-
-                successful_packs.append((zip_filename, fixed_count))
-                history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Fixed {fixed_count}")
-                time.sleep(0.3)
-
-            except Exception as e:
-                error_msg = str(e)[:45]
-                status_lines.append(f"{ICONS['cross']} Error: {error_msg}")
-                if ANSI_ENABLED:
-                    sys.stdout.write("\033[H\033[2J")
-                else:
-                    clear_screen_ansi()
-                sys.stdout.write(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
-                sys.stdout.flush()
-                failed_packs.append((zip_filename, str(e)))
-                history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Failed")
+                    error_msg = (error or '')[:45]
+                    status_lines = [f"{ICONS['cross']} Error: {error_msg}"]
+                    failed_packs.append((zip_filename, error or ''))
+                    history.append(f"[{idx}/{len(zip_files)}] {truncate_filename(zip_filename, 40)} | Failed")
 
-                temp_zip = zip_path + '.tmp'
-                if os.path.exists(temp_zip):
-                    try:
-                        os.remove(temp_zip)
-                    except:
-                        pass
-                time.sleep(0.3)
+                renderer.render(draw_frame(idx, len(zip_files), zip_filename, history, status_lines))
 
     finally:
         show_cursor()  # Always restore cursor
 
     # Final summary
-    time.sleep(0.3)
     clear_screen_ansi()
     print("="*70)
     print("  FINAL SUMMARY")